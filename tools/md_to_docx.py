@@ -1,7 +1,6 @@
+import shutil
+import subprocess
 from pathlib import Path
-from markdown import markdown
-from docx import Document
-from bs4 import BeautifulSoup
 
 md_file = Path('PROJECT_PROPOSAL_BMW_SALES.md')
 docx_file = Path('PROJECT_PROPOSAL_BMW_SALES.docx')
@@ -9,6 +8,18 @@ docx_file = Path('PROJECT_PROPOSAL_BMW_SALES.docx')
 if not md_file.exists():
     raise SystemExit(f'Markdown file not found: {md_file}')
 
+# Prefer pandoc when installed: native conversion that also keeps tables and code blocks
+pandoc = shutil.which('pandoc')
+if pandoc:
+    subprocess.run([pandoc, '-f', 'markdown', '-t', 'docx', '-o', str(docx_file), str(md_file)], check=True)
+    print(f'Wrote: {docx_file.resolve()}')
+    raise SystemExit(0)
+
+# Fallback: Markdown -> HTML -> python-docx
+from markdown import markdown
+from docx import Document
+from bs4 import BeautifulSoup
+
 md_text = md_file.read_text(encoding='utf-8')
 
 # Render markdown to HTML
@@ -22,26 +33,25 @@ doc = Document()
 def add_html_to_doc(element, container):
     """Recursively add HTML element content to the DOCX document."""
     for child in element.children:
-        if child.name is None:
+        name = child.name
+        if name is None:
             # plain text
             text = child.string.strip() if child.string else ''
             if text:
                 container.add_paragraph(text)
-        elif child.name in ['h1', 'h2', 'h3']:
-            level = 1 if child.name == 'h1' else (2 if child.name == 'h2' else 3)
+        elif name in ('h1', 'h2', 'h3'):
+            level = 1 if name == 'h1' else (2 if name == 'h2' else 3)
             container.add_heading(child.get_text().strip(), level=level)
-        elif child.name == 'p':
+        elif name == 'p':
             container.add_paragraph(child.get_text().strip())
-        elif child.name in ['ul', 'ol']:
+        elif name in ('ul', 'ol'):
+            style = 'List Number' if name == 'ol' else 'List Bullet'
             for li in child.find_all('li', recursive=False):
-                style = 'List Number' if child.name == 'ol' else 'List Bullet'
                 container.add_paragraph(li.get_text().strip(), style=style)
-        elif child.name == 'strong' or child.name == 'b':
-            p = container.add_paragraph()
-            p.add_run(child.get_text().strip()).bold = True
-        elif child.name == 'em' or child.name == 'i':
-            p = container.add_paragraph()
-            p.add_run(child.get_text().strip()).italic = True
+        elif name in ('strong', 'b'):
+            container.add_paragraph().add_run(child.get_text().strip()).bold = True
+        elif name in ('em', 'i'):
+            container.add_paragraph().add_run(child.get_text().strip()).italic = True
         else:
             # For any other tag, recurse
             add_html_to_doc(child, container)
@@ -1,20 +1,49 @@
 # watcher_commit_msg.py
 import os
+import functools
+import hashlib
 import subprocess
 import json
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
+
+try:
+    import pygit2
+except ImportError:  # optional: read history in-process instead of spawning git
+    pygit2 = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON responses
+    orjson = None
 
 # --- Configuration ---
 # IMPORTANT: Set this to the repository you are working with in GitHub Desktop
 REPO_ROOT = r'C:\Users\easts\github\bmw-sales-forecast'
 # How many recent commit messages to load (will fetch more and filter by author)
 COMMIT_LIMIT = 1000
+# Hard ceiling on commits walked per query; headroom above COMMIT_LIMIT for duplicate messages
+LOG_SCAN_LIMIT = COMMIT_LIMIT * 4
 # List of author names to filter by (show only commits from these authors)
 AUTHOR_NAMES = ['StephenEastham', 'easts']
+# Interned set for membership tests; returned author names are interned too
+AUTHOR_SET = frozenset(sys.intern(a) for a in AUTHOR_NAMES)
+# git log format that includes the author name
+# %H = full hash, %ai = author date ISO format, %an = author name, %s = subject
+# Fields are separated by %x1f (ASCII unit separator) and -z ends each record with NUL,
+# neither of which can appear in a subject
+LOG_FORMAT = "%H%x1f%ai%x1f%an%x1f%s"
+# Window shown in the log line: "<since date> - <today>"
+DATE_RANGE_FORMAT = "{since} - {today:%m/%d/%Y}"
 # Time period in days to look back for commits
 TIME_PERIOD_DAYS = 30
+# Largest look-back a client may request (larger values are clamped)
+MAX_PERIOD_DAYS = 3650
 
 # --- Helper Functions ---
 def run_git(args):
@@ -25,7 +54,9 @@ def run_git(args):
             cwd=REPO_ROOT,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
             check=False,
         )
         if result.returncode != 0:
@@ -39,86 +70,268 @@ def run_git(args):
         print(f"Error running git command: {e}", file=sys.stderr)
         return ""
 
+def stream_git(args, sep=b'\n'):
+    """Runs a git command and yields raw stdout records (bytes) split on `sep` as they arrive.
+
+    Decoding is left to the caller so records it discards are never decoded.
+    """
+    try:
+        proc = subprocess.Popen(
+            ['git'] + args,
+            cwd=REPO_ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        print("Error: 'git' command not found. Is Git installed and in your PATH?", file=sys.stderr)
+        return
+    except Exception as e:
+        print(f"Error running git command: {e}", file=sys.stderr)
+        return
+    # Drain stderr alongside stdout so a chatty git can't fill that pipe and stall
+    stderr_chunks = []
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    stderr_reader.start()
+    try:
+        pending = b''
+        for chunk in iter(lambda: proc.stdout.read(1 << 16), b''):
+            *records, pending = (pending + chunk).split(sep)
+            yield from records
+        if pending:
+            yield pending
+        proc.wait()
+        stderr_reader.join()
+        if proc.returncode != 0:
+            stderr = b''.join(stderr_chunks)
+            print(f"Git command error: {stderr.decode('utf-8', 'replace').strip()}", file=sys.stderr)
+    finally:
+        # Consumer stopped early: don't leave git writing into a closed pipe
+        if proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+        stderr_reader.join()
+        proc.stdout.close()
+        proc.stderr.close()
+
+class GitBackend:
+    """Reads the branch name and commit log, in-process via pygit2 when available, else via the git CLI."""
+
+    def __init__(self, repo_root):
+        self.repo = pygit2.Repository(repo_root) if pygit2 is not None else None
+        self._head_path = os.path.join(repo_root, '.git', 'HEAD')
+        self._head_cache = (None, "")  # (mtime_ns of .git/HEAD, branch)
+
+    def current_branch(self):
+        """Returns the checked-out branch name, or an empty string if it cannot be determined."""
+        if self.repo is None:
+            return self._read_head_branch()
+        if self.repo.head_is_unborn:
+            return ""
+        # Detached HEAD: show the abbreviated sha, like the .git/HEAD path
+        if self.repo.head_is_detached:
+            return str(self.repo.head.target)[:7]
+        return self.repo.head.shorthand
+
+    def _read_head_branch(self):
+        # .git/HEAD is a one-line file; reading it beats spawning `git symbolic-ref`
+        try:
+            mtime = os.stat(self._head_path).st_mtime_ns
+            if mtime == self._head_cache[0]:
+                return self._head_cache[1]
+            with open(self._head_path, 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+        except OSError:
+            return ""
+        # Detached HEAD holds a sha; show it abbreviated
+        branch = head[16:] if head.startswith('ref: refs/heads/') else head[:7]
+        self._head_cache = (mtime, branch)
+        return branch
+
+    def head_sha(self):
+        """Returns the commit id HEAD currently points at, or an empty string for an empty repository."""
+        if self.repo is None:
+            return run_git(['rev-parse', 'HEAD'])
+        if self.repo.head_is_unborn:
+            return ""
+        return str(self.repo.head.target)
+
+    def log(self, days, authors, max_count):
+        """Yields [hash, author date (ISO), author name, subject] for up to `max_count` non-merge
+        commits by `authors` from the last `days` days, newest first.
+
+        Fields are str from pygit2 and undecoded UTF-8 bytes from the git CLI.
+        """
+        if self.repo is None:
+            yield from self._log_cli(days, authors, max_count)
+            return
+        if self.repo.head_is_unborn:
+            return
+        # Same cutoff as git's --since=N.days.ago
+        since_ts = time.time() - days * 86400
+        count = 0
+        for commit in self.repo.walk(self.repo.head.target, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME):
+            if commit.commit_time < since_ts or count >= max_count:
+                break
+            author = commit.author
+            if len(commit.parents) > 1 or author.name not in authors:
+                continue
+            count += 1
+            tz = timezone(timedelta(minutes=author.offset))
+            date = datetime.fromtimestamp(author.time, tz).strftime('%Y-%m-%d %H:%M:%S %z')
+            # Same as git's %s: the first paragraph of the message joined onto one line
+            subject = ' '.join(commit.message.split('\n\n', 1)[0].split())
+            yield [str(commit.id), date, author.name, subject]
+
+    def _log_cli(self, days, authors, max_count):
+        # Let git do the filtering: --author flags are OR-ed and match "Name <email>",
+        # so anchor each name to keep exact-name matching
+        author_args = [f'--author=^{name} <' for name in authors]
+        for record in stream_git(['log', '-z', f'--since={days}.days.ago', '--no-merges', *author_args,
+                                  f'--max-count={max_count}', f'--pretty=format:{LOG_FORMAT}'], sep=b'\0'):
+            if not record:
+                continue
+            yield record.split(b'\x1f', 3)
+
+
+_backend = None
+_git_lock = threading.Lock()
+
+def get_backend():
+    """Returns the process-wide GitBackend, opening the repository on first use."""
+    global _backend
+    if _backend is None:
+        _backend = GitBackend(REPO_ROOT)
+    return _backend
+
 def get_commit_messages(days=TIME_PERIOD_DAYS):
-    """Gets recent commit messages from the repository, filtered by author and deduplicated."""
-    # Get current branch name
-    current_branch = run_git(['symbolic-ref', '--short', 'HEAD'])
-    if not current_branch:
-        current_branch = "unknown"
-    
-    # Use git log with a format that includes the author name
-    # %H = full hash, %ai = author date ISO format, %an = author name, %s = subject
-    log_format = "%H|||%ai|||%an|||%s"
-    
-    # Calculate date based on the 'days' parameter
-    start_date = datetime.now() - timedelta(days=days)
-    since_date = start_date.strftime('%Y-%m-%d')
-    
-    output = run_git(['log', f'--since={since_date}', f'--pretty=format:{log_format}%n'])
-    
-    if not output:
-        print("Warning: No commits found in repository.", file=sys.stderr)
-        return [], since_date, current_branch
+    """Gets recent commit messages from the repository, filtered by author and deduplicated.
 
+    Returns (messages, since_date, current_branch, head_sha).
+    """
+    # Git computes the cutoff itself; the date is only for display and cache rollover
+    now = datetime.now()
+    since_date = (now - timedelta(days=days)).date().isoformat()
+
+    # Requests are served on several threads; a pygit2 Repository must not be used concurrently
+    with _git_lock:
+        backend = get_backend()
+
+        # Get current branch name
+        current_branch = backend.current_branch()
+        if not current_branch:
+            current_branch = "unknown"
+
+        # The history for a given HEAD never changes, so repeat loads are served from the cache
+        head_sha = backend.head_sha()
+        messages = _scan(head_sha, days, since_date)
+    date_range = DATE_RANGE_FORMAT.format(since=since_date, today=now)
+    print(f"Loaded {len(messages)} unique commits from {AUTHOR_NAMES} in last {days} days on branch '{current_branch}' ({date_range}).", file=sys.stderr)
+    return messages, since_date, current_branch, head_sha
+
+@functools.lru_cache(maxsize=64)
+def _scan(head_sha, days, since_date):
+    """Walks the last `days` days of log and returns the deduplicated commit list.
+
+    Cached per HEAD sha; `since_date` is part of the key only so cached windows roll over daily.
+    """
     # Dictionary to track unique messages (message -> commit info)
     # We keep only the most recent commit for each unique message
     unique_messages = {}
-    lines = output.strip().split('\n')
+    seen_any = False
     
-    for line in lines:
-        if not line.strip():
+    # The backend only yields commits by AUTHOR_NAMES, at most LOG_SCAN_LIMIT of them
+    for parts in get_backend().log(days, AUTHOR_SET, LOG_SCAN_LIMIT):
+        seen_any = True
+        if len(parts) < 4:
+            continue
+        # git emits %s already trimmed
+        message = parts[3]
+        # Only keep the first occurrence of each message
+        # (since we're iterating in reverse chronological order, the first occurrence is the most recent)
+        if message in unique_messages:
             continue
-        parts = line.split('|||')
-        if len(parts) >= 4:
-            author = parts[2].strip()
-            # Filter by author names in AUTHOR_NAMES
-            if author in AUTHOR_NAMES:
-                message = parts[3].strip()
-                commit_info = {
-                    "hash": parts[0][:7],  # Short hash
-                    "date": parts[1],
-                    "author": author,
-                    "message": message
-                }
-                
-                # Only add if we haven't seen this message before
-                # (since we're iterating in reverse chronological order, the first occurrence is the most recent)
-                if message not in unique_messages:
-                    unique_messages[message] = commit_info
-                
-                if len(unique_messages) >= COMMIT_LIMIT:
-                    break
+        # (short hash, date, author); dicts are only built, and bytes decoded, once the scan is done
+        unique_messages[message] = (parts[0][:7], parts[1], parts[2])
+        if len(unique_messages) >= COMMIT_LIMIT:
+            break
+
+    if not seen_any:
+        print("Warning: No commits found in repository.", file=sys.stderr)
     
     # Convert to list, maintaining order
-    messages = list(unique_messages.values())
-    date_range = f"{since_date} - {datetime.now().strftime('%m/%d/%Y')}"
-    print(f"Loaded {len(messages)} unique commits from {AUTHOR_NAMES} in last {days} days on branch '{current_branch}' ({date_range}).", file=sys.stderr)
-    return messages, since_date, current_branch
+    return [
+        {"hash": _text(h), "date": _text(d), "author": sys.intern(_text(a)), "message": _text(m)}
+        for m, (h, d, a) in unique_messages.items()
+    ]
+
+def _text(value):
+    """Decodes a git CLI field (UTF-8 bytes); pygit2 fields are already str."""
+    return value if isinstance(value, str) else value.decode('utf-8', 'replace')
 
 # --- Flask Web Server ---
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
+INDEX_HTML = 'commit_messages-can-change-values.html'
+
+# The page rarely changes, so read it once and serve it from memory
+try:
+    with open(os.path.join(app.root_path, INDEX_HTML), 'rb') as f:
+        _index_html = f.read()
+except OSError:
+    _index_html = None
 
 @app.route('/')
 def index():
     """Serve the main HTML file."""
-    return send_from_directory('.', 'commit_messages-can-change-values.html')
+    if _index_html is None:
+        # Not present at startup: serve from disk as before (404 if still missing)
+        return send_from_directory('.', INDEX_HTML)
+    return app.response_class(_index_html, mimetype='text/html',
+                              headers={'Cache-Control': 'public, max-age=60'})
 
 @app.route('/commits')
 def list_commits():
     """Return a list of recent commit messages."""
-    try:
-        days = request.args.get('days', default=TIME_PERIOD_DAYS, type=int)
-        commits, since_date, current_branch = get_commit_messages(days=days)
+    days = request.args.get('days', default=TIME_PERIOD_DAYS, type=int)
+    if days < 1:
+        return jsonify({'error': 'invalid days', 'commits': [], 'time_period_days': 0, 'current_branch': 'unknown'}), 400
+    days = min(days, MAX_PERIOD_DAYS)
+    commits, since_date, current_branch, head_sha = get_commit_messages(days=days)
+    # The payload is fully determined by these, so the client can revalidate cheaply
+    etag = hashlib.sha1(f"{head_sha}|{days}|{since_date}|{current_branch}".encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
         print(f"Returning {len(commits)} commits to client from branch '{current_branch}'.", file=sys.stderr)
-        return jsonify({
+        response = jsonify({
             'commits': commits,
             'time_period_days': days,
             'since_date': since_date,
             'current_branch': current_branch
         })
-    except Exception as e:
-        print(f"Error in /commits endpoint: {e}", file=sys.stderr)
-        return jsonify({'error': str(e), 'commits': [], 'time_period_days': 0, 'current_branch': 'unknown'}), 500
+    response.set_etag(etag)
+    # Always revalidate, so browsers send If-None-Match on every load
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.errorhandler(Exception)
+def handle_error(e):
+    """Report unexpected errors as JSON the client can still render; HTTP errors pass through."""
+    if isinstance(e, HTTPException):
+        return e
+    app.logger.exception(f"Error in {request.path}: {e}")
+    return jsonify({'error': str(e), 'commits': [], 'time_period_days': 0, 'current_branch': 'unknown'}), 500
 
 if __name__ == '__main__':
     if not os.path.isdir(REPO_ROOT) or not os.path.isdir(os.path.join(REPO_ROOT, '.git')):
@@ -130,4 +343,10 @@ if __name__ == '__main__':
     print(f"Watching repository: {REPO_ROOT}")
     print("Open http://127.0.0.1:5001/ in your browser.")
     print("Press Ctrl+C to stop.\n")
-    app.run(host='127.0.0.1', port=5001, debug=False, use_reloader=True)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Werkzeug's dev server, threaded and without the reloader's second process
+        app.run(host='127.0.0.1', port=5001, debug=False, threaded=True, use_reloader=False)
+    else:
+        serve(app, host='127.0.0.1', port=5001, threads=8)
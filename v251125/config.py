@@ -2,6 +2,8 @@
 Configuration and constants for BMW Sales Forecasting System
 """
 
+import functools
+import os
 from pathlib import Path
 import matplotlib
 import matplotlib.pyplot as plt
@@ -15,11 +17,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 # Output directory for generated artifacts (inside the project root)
 OUTPUT_DIR = PROJECT_ROOT / 'outputs'
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+OUTPUT_DIR_STR = str(OUTPUT_DIR)
 
 
+@functools.lru_cache(maxsize=128)
 def out_path(name: str) -> str:
-    """Return a path inside the outputs directory as a string."""
-    return str(OUTPUT_DIR / name)
+    """Return a path inside the outputs directory as a string (cached per name)."""
+    return os.path.join(OUTPUT_DIR_STR, name)
 
 
 # Matplotlib configuration
@@ -40,6 +44,15 @@ HOWTO_URL = 'https://raw.githubusercontent.com/StephenEastham/bmw-sales-forecast
 DATA_CSV_FILE = 'BMW-sales-data-2010-2024.csv'
 HOWTO_FILE = 'how-to-test.md'
 
+# Columns used by the pipeline and their load dtypes (keys are header names after stripping)
+CSV_DTYPES = {
+    'Model': 'category',
+    'Year': 'int16',
+    'Region': 'category',
+    'Price_USD': 'int32',
+    'Sales_Volume': 'int32',
+}
+
 # Forecasting parameters
 ARIMA_ORDER = (1, 1, 1)
 FORECAST_STEPS = 3
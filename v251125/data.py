@@ -3,11 +3,14 @@ Data loading, downloading, and preprocessing
 """
 
 import os
+import logging
 import requests
 import pandas as pd
-from config import DATA_CSV_FILE, HOWTO_FILE, DATA_CSV_URL, HOWTO_URL
+from config import DATA_CSV_FILE, HOWTO_FILE, DATA_CSV_URL, HOWTO_URL, CSV_DTYPES
 from utils import print_section
 
+logger = logging.getLogger(__name__)
+
 
 def download_data_file(file_name, data_url):
     """Download data file from URL if not exists"""
@@ -35,15 +38,19 @@ def load_and_explore_data(csv_path):
     """Load and display dataset overview"""
     print_section("📊 DATASET OVERVIEW")
     
-    df = pd.read_csv(csv_path)
+    # Header names are space-padded in the CSV, so map the padded names to CSV_DTYPES
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtypes = {col: CSV_DTYPES[col.strip()] for col in header if col.strip() in CSV_DTYPES}
+    df = pd.read_csv(csv_path, usecols=list(dtypes), dtype=dtypes, engine='c')
     print(f"\n✅ Data loaded successfully!")
     print(f"Shape: {df.shape}")
-    print(f"\nFirst few rows:")
-    print(df.head(10))
     print(f"\nColumn names and types:")
     print(df.dtypes)
-    print(f"\nData summary:")
-    print(df.describe())
+    
+    # Frame previews/describe are only formatted when DEBUG logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("First few rows:\n%s", df.head(10).to_string())
+        logger.debug("Data summary:\n%s", df.describe().to_string())
     
     return df
 
@@ -2,7 +2,9 @@
 Reporting and data export
 """
 
+import os
 import pandas as pd
+from collections import Counter
 from datetime import datetime
 from config import out_path
 from utils import print_section
@@ -72,8 +74,8 @@ Generated: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}
 """
     
     by_region = df_clean.groupby('Region')['Sales_Volume'].sum().sort_values(ascending=False)
-    for region, sales in by_region.items():
-        pct = (sales / by_region.sum() * 100)
+    region_pcts = by_region / by_region.sum() * 100.0
+    for (region, sales), pct in zip(by_region.items(), region_pcts):
         report += f"\n   • {region}: {sales:,.0f} ({pct:.1f}%)"
     
     report += f"""
@@ -139,6 +141,8 @@ def generate_final_summary(df_clean, average_sales, ts_years, ts_data, future_ye
     """Generate and save final summary"""
     import numpy as np
     
+    severity_counts = Counter(a.get('severity', 'UNKNOWN') for a in alert_system.alerts)
+    
     summary = f"""
 {'='*80}
 BMW SALES TREND FORECASTING & ALERT SYSTEM - PROJECT COMPLETE
@@ -166,8 +170,8 @@ ANALYSIS COMPLETED:
 
 4. Alert System Status:
    • Active alerts: {len(alert_system.alerts)}
-   • High severity: {len([a for a in alert_system.alerts if a.get('severity') == 'HIGH'])}
-   • Medium severity: {len([a for a in alert_system.alerts if a.get('severity') == 'MEDIUM'])}
+   • High severity: {severity_counts['HIGH']}
+   • Medium severity: {severity_counts['MEDIUM']}
 
 5. Visualizations Generated:
    [OK] 01_sales_overview.png - Overview charts (4-panel analysis)
@@ -208,7 +212,10 @@ PROJECT STATUS: COMPLETE & READY FOR PRODUCTION
     
     print(summary)
     
-    with open(out_path('ANALYSIS_SUMMARY.txt'), 'w', encoding='utf-8') as f:
-        f.write(summary)
+    # Write to a temp file then swap it in, so readers never see a partial summary
+    tmp_path = out_path('ANALYSIS_SUMMARY.txt.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(summary.encode('utf-8'))
+    os.replace(tmp_path, out_path('ANALYSIS_SUMMARY.txt'))
 
     print(f"\n[OK] Saved: {out_path('ANALYSIS_SUMMARY.txt')}")
@@ -6,10 +6,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 from config import out_path
 from utils import print_section
 
+# Use orjson for write_html serialization when installed (much faster on numpy arrays)
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
 
 def create_overview_visualizations(df_yearly, df_clean):
     """Create static overview visualizations"""
@@ -101,15 +109,14 @@ def visualize_forecast(ts_data, ts_years, train_size, forecast_test_values, fore
     
     # Confidence intervals
     try:
+        # conf_int() may be a DataFrame or an ndarray; take plain (lower, upper) arrays
         if forecast_test_ci is not None:
-            ax.fill_between(test_years, 
-                             forecast_test_ci.iloc[:, 0], 
-                             forecast_test_ci.iloc[:, 1], 
+            test_ci_lo, test_ci_hi = np.asarray(forecast_test_ci).T
+            ax.fill_between(test_years, test_ci_lo, test_ci_hi, 
                              alpha=0.2, color='#ff7f0e')
         if future_ci is not None:
-            ax.fill_between(future_years, 
-                             future_ci.iloc[:, 0], 
-                             future_ci.iloc[:, 1], 
+            future_ci_lo, future_ci_hi = np.asarray(future_ci).T
+            ax.fill_between(future_years, future_ci_lo, future_ci_hi, 
                              alpha=0.2, color='#2ca02c')
     except:
         pass
@@ -142,10 +149,15 @@ def forecast_model_specific(df_model_yearly, top_models, model_thresholds):
     axes = axes.flatten()
     fig.suptitle('Top 5 BMW Models: Sales Forecast', fontsize=16, fontweight='bold')
     
+    # Sort and split once instead of masking the whole frame per model
+    model_groups = dict(list(
+        df_model_yearly.sort_values('Year').groupby('Model', sort=False, observed=True)
+    ))
+    
     for idx, model in enumerate(top_models):
-        model_data = df_model_yearly[df_model_yearly['Model'] == model].sort_values('Year')
+        model_data = model_groups.get(model)
         
-        if len(model_data) > 2:
+        if model_data is not None and len(model_data) > 2:
             model_sales = model_data['Sales_Volume'].values
             model_years = model_data['Year'].values
             
@@ -209,7 +221,7 @@ def create_interactive_dashboard(ts_years, ts_data, future_years, future_values,
     
     fig_forecast.add_trace(
         go.Scatter(
-            x=ts_years, y=ts_data, mode='lines+markers',
+            x=np.asarray(ts_years), y=np.asarray(ts_data), mode='lines+markers',
             name='Historical Sales', line=dict(color='#1f77b4', width=2),
             marker=dict(size=8)
         ),
@@ -218,18 +230,19 @@ def create_interactive_dashboard(ts_years, ts_data, future_years, future_values,
     
     fig_forecast.add_trace(
         go.Scatter(
-            x=future_years, y=future_values, mode='lines+markers',
+            x=np.asarray(future_years), y=np.asarray(future_values), mode='lines+markers',
             name='Forecast', line=dict(color='#2ca02c', width=2, dash='dash'),
             marker=dict(size=10)
         ),
         row=1, col=1
     )
     
+    yoy_growth = df_yearly['YoY_Growth'][1:].to_numpy()
     fig_forecast.add_trace(
         go.Bar(
-            x=df_yearly['Year'][1:], y=df_yearly['YoY_Growth'][1:],
+            x=df_yearly['Year'][1:].to_numpy(), y=yoy_growth,
             name='Growth Rate', marker=dict(
-                color=df_yearly['YoY_Growth'][1:],
+                color=yoy_growth,
                 colorscale='RdYlGn', showscale=False
             )
         ),
@@ -239,7 +252,7 @@ def create_interactive_dashboard(ts_years, ts_data, future_years, future_values,
     top_5_models = df_clean.groupby('Model')['Sales_Volume'].sum().nlargest(5).sort_values()
     fig_forecast.add_trace(
         go.Bar(
-            y=top_5_models.index, x=top_5_models.values,
+            y=top_5_models.index.to_numpy(), x=top_5_models.to_numpy(),
             orientation='h', name='Model Sales', 
             marker=dict(color='#ff7f0e')
         ),
@@ -249,7 +262,7 @@ def create_interactive_dashboard(ts_years, ts_data, future_years, future_values,
     region_dist = df_clean.groupby('Region')['Sales_Volume'].sum()
     fig_forecast.add_trace(
         go.Pie(
-            labels=region_dist.index, values=region_dist.values,
+            labels=region_dist.index.to_numpy(), values=region_dist.to_numpy(),
             name='Regions'
         ),
         row=2, col=2
@@ -287,8 +300,8 @@ def create_heatmap_interactive(df_model_yearly):
     
     fig_heatmap = go.Figure(data=go.Heatmap(
         z=heatmap_data_pivot.values,
-        x=heatmap_data_pivot.columns,
-        y=heatmap_data_pivot.index,
+        x=heatmap_data_pivot.columns.to_numpy(),
+        y=heatmap_data_pivot.index.to_numpy(),
         colorscale='YlOrRd',
         colorbar=dict(title='Sales')
     ))
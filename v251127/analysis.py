@@ -32,8 +32,8 @@ def aggregate_time_series(df_clean):
     print(f"\n📊 Year-over-Year Growth:")
     print(df_yearly[['Year', 'Total_Sales', 'YoY_Growth']].to_string(index=False))
     
-    df_model_yearly = df_clean.groupby(['Year', 'Model'])['Sales_Volume'].sum().reset_index()
-    df_region_yearly = df_clean.groupby(['Year', 'Region'])['Sales_Volume'].sum().reset_index()
+    df_model_yearly = df_clean.groupby(['Year', 'Model'], observed=True)['Sales_Volume'].sum().reset_index()
+    df_region_yearly = df_clean.groupby(['Year', 'Region'], observed=True)['Sales_Volume'].sum().reset_index()
     
     print(f"\n✅ Model and Region time series aggregations complete")
     
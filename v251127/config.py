@@ -4,6 +4,7 @@ Configuration and constants for BMW Sales Forecasting System
 
 from pathlib import Path
 import matplotlib
+matplotlib.use('Agg')  # select backend before pyplot is imported
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
@@ -16,17 +17,52 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 OUTPUT_DIR = PROJECT_ROOT / 'outputs'
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# On-disk cache of fitted ARIMA models (outside OUTPUT_DIR so clean_outputs keeps it)
+ARIMA_CACHE_DIR = PROJECT_ROOT / '.arima_cache'
+
 def out_path(name: str) -> str:
     """Return a path inside the outputs directory as a string."""
     return str(OUTPUT_DIR / name)
 
 
 # Matplotlib configuration
+# Inline copy of the 'seaborn-v0_8-darkgrid' stylesheet (avoids reading/parsing it from disk)
+_STYLE = {
+    'figure.facecolor': 'white',
+    'text.color': '.15',
+    'axes.labelcolor': '.15',
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.linewidth': 0,
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'grid.color': 'white',
+    'grid.linestyle': '-',
+    'legend.frameon': False,
+    'legend.numpoints': 1,
+    'legend.scatterpoints': 1,
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.major.size': 0,
+    'ytick.major.size': 0,
+    'xtick.minor.size': 0,
+    'ytick.minor.size': 0,
+    'image.cmap': 'Greys',
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'Liberation Sans', 'DejaVu Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'lines.solid_capstyle': 'round',
+}
+
 warnings.filterwarnings('ignore')
-matplotlib.use('Agg')
-plt.style.use('seaborn-v0_8-darkgrid')
+plt.rcParams.update(_STYLE)
 sns.set_palette("husl")
 
+# PNG resolution: 300 dpi for publication-quality output, 150 for faster everyday runs
+HIGH_RES_PLOTS = True
+PLOT_DPI = 300 if HIGH_RES_PLOTS else 150
+
 # Pandas options
 pd.set_option('display.max_columns', None)
 pd.set_option('display.max_rows', 100)
@@ -44,6 +80,13 @@ ARIMA_ORDER = (1, 1, 1)
 FORECAST_STEPS = 3
 TRAIN_TEST_SPLIT = 0.8
 
+# Use statsforecast AutoARIMA (batched across models) for model-specific forecasts.
+# Requires the optional `statsforecast` package; falls back to per-model statsmodels ARIMA.
+USE_STATSFORECAST = False
+
+# Print the full statsmodels ARIMA summary table (slow to build; off by default)
+VERBOSE_ARIMA_SUMMARY = False
+
 # Alert thresholds (multipliers)
 OVERALL_THRESHOLD_MULTIPLIER = 0.8
 MODEL_THRESHOLD_MULTIPLIER = 0.8
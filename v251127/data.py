@@ -63,6 +63,9 @@ def preprocess_data(df):
     
     df_clean.columns = df_clean.columns.str.strip()
     
+    # Categorical codes make the repeated groupby('Model') calls hash ints, not strings
+    df_clean['Model'] = df_clean['Model'].astype('category')
+    
     # Warn if any column has no non-empty values (NaN or whitespace-only strings)
     empty_columns = []
     for col in df_clean.columns:
@@ -97,7 +97,7 @@ def main():
     
     # ===== MODEL-SPECIFIC FORECASTS =====
     if ENABLE_MODEL_FORECASTS:
-        top_models = df_clean.groupby('Model')['Sales_Volume'].sum().nlargest(5).index.tolist()
+        top_models = df_clean.groupby('Model', sort=False, observed=True)['Sales_Volume'].sum().nlargest(5).index.tolist()
         model_forecasts = calculate_model_forecasts(df_model_yearly, top_models)
         plot_model_forecasts(model_forecasts)
     
@@ -155,8 +155,9 @@ def main():
         print(monthly_report)
         
         report_filename = out_path(f"sales_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            f.write(monthly_report)
+        # Encode once; the buffered file loops until every byte is written
+        with open(report_filename, 'wb') as f:
+            f.write(monthly_report.encode('utf-8'))
         print(f"\n✅ Saved: {report_filename}")
     
     # ===== INTERACTIVE DASHBOARDS =====
@@ -208,7 +208,7 @@ PROJECT STATUS: COMPLETE & READY FOR PRODUCTION
     
     print(summary)
     
-    with open(out_path('ANALYSIS_SUMMARY.txt'), 'w', encoding='utf-8') as f:
-        f.write(summary)
+    with open(out_path('ANALYSIS_SUMMARY.txt'), 'wb') as f:
+        f.write(summary.encode('utf-8'))
 
     print(f"\n[OK] Saved: {out_path('ANALYSIS_SUMMARY.txt')}")
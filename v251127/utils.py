@@ -4,21 +4,43 @@ Utility functions: logging, paths, and helpers
 
 import logging
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from config import out_path, OUTPUT_DIR
 
 
+def _log_rm_error(func, path, exc):
+    """shutil.rmtree error handler: report the failure and keep going.
+
+    `exc` is the exception (onexc, 3.12+) or an exc_info tuple (onerror, older Pythons).
+    """
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    print(f"Failed to delete {path}: {exc}")
+
+
+def _remove_output_item(item):
+    """Delete one file or directory from the output directory."""
+    if item.is_dir() and not item.is_symlink():
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(item, onexc=_log_rm_error)
+        else:
+            shutil.rmtree(item, onerror=_log_rm_error)
+    else:
+        item.unlink(missing_ok=True)
+
+
 def clean_outputs():
     """Delete all files in the output directory."""
     print(f"Cleaning output directory: {OUTPUT_DIR}")
     if OUTPUT_DIR.exists():
-        for item in OUTPUT_DIR.iterdir():
-            try:
-                if item.is_file():
-                    item.unlink()
-                elif item.is_dir():
-                    shutil.rmtree(item)
-            except Exception as e:
-                print(f"Failed to delete {item}: {e}")
+        items = list(OUTPUT_DIR.iterdir())
+        # Deletions are independent, I/O-bound syscalls: issue them concurrently
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = {pool.submit(_remove_output_item, item): item for item in items}
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    print(f"Failed to delete {futures[future]}: {future.exception()}")
     else:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -52,6 +74,7 @@ def zip_all_outputs(zip_filename=None, patterns=('*.png','*.html','*.csv','*.txt
     """
     from zipfile import ZipFile, ZIP_DEFLATED
     from pathlib import Path
+    from fnmatch import fnmatch
     import os
 
     if zip_filename is None:
@@ -64,17 +87,21 @@ def zip_all_outputs(zip_filename=None, patterns=('*.png','*.html','*.csv','*.txt
     # Ensure OUTPUT_DIR exists
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+    # One directory scan for all patterns (instead of one glob per pattern)
+    patterns = tuple(patterns)
+    with os.scandir(OUTPUT_DIR) as it:
+        entries = [entry for entry in it
+                   if entry.is_file() and any(fnmatch(entry.name, pat) for pat in patterns)]
+
     added = 0
     try:
-        with ZipFile(zip_path, 'w', ZIP_DEFLATED) as zf:
-            for pat in patterns:
-                for p in OUTPUT_DIR.glob(pat):
-                    if p.is_file():
-                        zf.write(p, arcname=p.name)
-                        added += 1
+        # Level 1: outputs are mostly PNGs, which DEFLATE cannot shrink further
+        with ZipFile(zip_path, 'w', ZIP_DEFLATED, compresslevel=1) as zf:
+            for entry in entries:
+                zf.write(entry.path, arcname=entry.name)
+                added += 1
         print(f"✅ Created zip: {zip_path.resolve()} ({added} files)")
         return zip_path
     except Exception as e:
         print(f"⚠️ Error while creating zip: {e}")
         raise
-
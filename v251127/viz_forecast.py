@@ -4,13 +4,22 @@ Forecast visualizations
 
 import numpy as np
 import matplotlib.pyplot as plt
-from config import out_path
+from config import out_path, PLOT_DPI
 from utils import print_section
 
+# Reused across visualize_forecast calls (cleared each time instead of reallocated)
+_FORECAST_FIG = None
+
+
 def visualize_forecast(ts_data, ts_years, train_size, forecast_test_values, forecast_test_ci, 
                        future_values, future_years, future_ci):
     """Visualize forecast results"""
-    fig, ax = plt.subplots(figsize=(14, 6))
+    global _FORECAST_FIG
+    if _FORECAST_FIG is None:
+        _FORECAST_FIG = plt.figure(figsize=(14, 6))
+    fig = _FORECAST_FIG
+    fig.clear()
+    ax = fig.add_subplot(111)
     
     ax.plot(ts_years, ts_data, marker='o', linewidth=2.5, markersize=8, 
             label='Historical Sales', color='#1f77b4')
@@ -25,15 +34,14 @@ def visualize_forecast(ts_data, ts_years, train_size, forecast_test_values, fore
     
     # Confidence intervals
     try:
+        # conf_int() may be a DataFrame or an ndarray; take plain (lower, upper) arrays
         if forecast_test_ci is not None:
-            ax.fill_between(test_years, 
-                             forecast_test_ci.iloc[:, 0], 
-                             forecast_test_ci.iloc[:, 1], 
+            test_ci_lo, test_ci_hi = np.asarray(forecast_test_ci).T
+            ax.fill_between(test_years, test_ci_lo, test_ci_hi, 
                              alpha=0.2, color='#ff7f0e')
         if future_ci is not None:
-            ax.fill_between(future_years, 
-                             future_ci.iloc[:, 0], 
-                             future_ci.iloc[:, 1], 
+            future_ci_lo, future_ci_hi = np.asarray(future_ci).T
+            ax.fill_between(future_years, future_ci_lo, future_ci_hi, 
                              alpha=0.2, color='#2ca02c')
     except:
         pass
@@ -46,11 +54,10 @@ def visualize_forecast(ts_data, ts_years, train_size, forecast_test_values, fore
                 fontsize=14, fontweight='bold')
     ax.legend(fontsize=10)
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
     p = out_path('03_arima_forecast.png')
-    plt.savefig(p, dpi=300, bbox_inches='tight')
+    fig.savefig(p, dpi=PLOT_DPI, bbox_inches='tight')
     print(f"✅ Saved: {p}")
-    plt.close()
 
 
 def plot_model_forecasts(model_forecasts):
@@ -61,8 +68,11 @@ def plot_model_forecasts(model_forecasts):
         print("   ⚠️ No model forecasts to plot.")
         return
 
-    fig, axes = plt.subplots(2, 3, figsize=(18, 10))
-    axes = axes.flatten()
+    # Only allocate as many rows of 3 panels as there are models to plot
+    n = min(len(model_forecasts), 5)
+    rows = (n + 2) // 3
+    fig, axes = plt.subplots(rows, 3, figsize=(6 * 3, 5 * rows))
+    axes = np.atleast_1d(axes).flatten()
     fig.suptitle('Top 5 BMW Models: Sales Forecast', fontsize=16, fontweight='bold')
     
     for idx, (model, data) in enumerate(model_forecasts.items()):
@@ -79,10 +89,11 @@ def plot_model_forecasts(model_forecasts):
         ax.grid(True, alpha=0.3)
     
     # Hide unused subplots
-    for i in range(len(model_forecasts), len(axes)):
+    for i in range(n, len(axes)):
         fig.delaxes(axes[i])
     
     plt.tight_layout()
     p = out_path('04_model_forecasts.png')
-    plt.savefig(p, dpi=300, bbox_inches='tight')
+    plt.savefig(p, dpi=PLOT_DPI, bbox_inches='tight')
     print(f"\n✅ Saved: {p}")
+    plt.close(fig)
@@ -1,8 +1,5 @@
 from pathlib import Path
 import warnings
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 
 # Project root and outputs directory
@@ -18,9 +15,28 @@ def out_path(name: str) -> str:
 
 # Minimal plotting and pandas configuration for reproducible visuals
 warnings.filterwarnings("ignore")
-matplotlib.use("Agg")
-plt.style.use("seaborn-v0_8-darkgrid")
-sns.set_palette("husl")
+
+_plotting_ready = False
+
+
+def setup_plotting() -> None:
+    """Import and configure matplotlib/seaborn on first use.
+
+    Plotting modules call this before drawing so runs that never plot skip
+    the matplotlib/seaborn import cost.
+    """
+    global _plotting_ready
+    if _plotting_ready:
+        return
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use("seaborn-v0_8-darkgrid")
+    sns.set_palette("husl")
+    _plotting_ready = True
+
 
 pd.set_option("display.max_columns", None)
 pd.set_option("display.max_rows", 100)
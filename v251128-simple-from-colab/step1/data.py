@@ -7,24 +7,57 @@ import config
 from utils import print_section  # lightweight dependency on utils
 
 
-def download_data_file(file_name: str, data_url: str | None = None) -> None:
+def download_data_file(file_name: str, data_url: str | None = None, force: bool = False) -> None:
     """Download a file if it does not already exist locally.
 
     This function avoids downloading if the file is present which is useful
-    for iterative development in notebooks.
+    for iterative development in notebooks. If the server ETag was saved
+    next to the file (as `<file>.etag`) the local copy is revalidated, so an
+    unchanged remote file is not transferred again. `force=True` downloads
+    even when no ETag is known.
     """
     if data_url is None:
         data_url = config.DATA_CSV_URL
 
-    if not os.path.exists(file_name):
-        print(f"Attempting to download {file_name} from {data_url}...")
-        response = requests.get(data_url)
-        response.raise_for_status()
-        with open(file_name, "wb") as f:
-            f.write(response.content)
-        print(f"Downloaded {file_name}")
-    else:
+    etag_file = file_name + ".etag"
+    have_file = os.path.exists(file_name)
+    have_etag = have_file and os.path.exists(etag_file)
+    if have_file and not have_etag and not force:
         print(f"{file_name} already exists; skipping download")
+        return
+
+    headers = {}
+    if have_etag:
+        with open(etag_file, "r", encoding="utf-8") as f:
+            headers["If-None-Match"] = f.read().strip()
+
+    print(f"Attempting to download {file_name} from {data_url}...")
+    tmp_name = file_name + ".part"
+    try:
+        with requests.get(data_url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code == 304:
+                print(f"{file_name} unchanged on server; keeping local copy")
+                return
+            response.raise_for_status()
+            # Stream to a temp file so an interrupted download never leaves a truncated CSV
+            with open(tmp_name, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            etag = response.headers.get("ETag")
+        os.replace(tmp_name, file_name)
+    except BaseException as e:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        if isinstance(e, requests.RequestException) and have_file and not force:
+            # Revalidation is best-effort; work offline from the cached copy
+            print(f"Could not revalidate {file_name} ({e}); keeping local copy")
+            return
+        raise
+
+    if etag:
+        with open(etag_file, "w", encoding="utf-8") as f:
+            f.write(etag)
+    print(f"Downloaded {file_name}")
 
 
 def download_required_files() -> None:
@@ -39,7 +72,21 @@ def load_and_explore_data(csv_path: str, nrows: int = 10) -> pd.DataFrame:
     Returns: DataFrame
     """
     print_section("DATASET OVERVIEW")
-    df = pd.read_csv(csv_path)
+    try:
+        # Arrow's multithreaded reader; columns stay Arrow-backed downstream
+        df = pd.read_csv(csv_path, engine="pyarrow", dtype_backend="pyarrow")
+    except ImportError:
+        df = pd.read_csv(csv_path)
+
+    # Shrink columns to the smallest safe dtype: less memory bandwidth downstream
+    for col in df.select_dtypes("integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes("float").columns:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    for col in df.select_dtypes(["object", "string"]).columns:
+        if df[col].nunique() / len(df) < 0.5:
+            df[col] = df[col].astype("category")
+
     print("Shape:", df.shape)
     print("First rows:")
     print(df.head(nrows))
@@ -48,6 +95,16 @@ def load_and_explore_data(csv_path: str, nrows: int = 10) -> pd.DataFrame:
     return df
 
 
+def _is_all_blank(s: pd.Series) -> bool:
+    """True if every non-NaN value in `s` is an empty/whitespace-only string."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        # Only the observed categories need checking, not every row
+        values = pd.Series(s.cat.remove_unused_categories().cat.categories)
+    else:
+        values = s.dropna()
+    return not values.astype(str).str.strip().ne("").any()
+
+
 def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     """Return a cleaned copy of `df`.
 
@@ -55,16 +112,14 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     df_clean = df.copy()
     df_clean.columns = df_clean.columns.str.strip()
-    empty_columns = []
-    for col in df_clean.columns:
-        non_na = ~df_clean[col].isna()
-        if non_na.any():
-            non_empty = df_clean.loc[non_na, col].astype(str).str.strip() != ""
-            has_values = non_empty.any()
-        else:
-            has_values = False
-        if not has_values:
-            empty_columns.append(col)
+    # A column is empty if it is all-NaN, or (text columns) all-NaN/whitespace
+    non_na_counts = df_clean.notna().sum()
+    text_cols = df_clean.select_dtypes(["object", "string", "category"]).columns
+    blank_text = df_clean[text_cols].apply(_is_all_blank) if len(text_cols) else pd.Series(dtype=bool)
+    empty_columns = [
+        col for col in df_clean.columns
+        if non_na_counts[col] == 0 or bool(blank_text.get(col, False))
+    ]
     if empty_columns:
         print("Warning: empty columns:", empty_columns)
     return df_clean
@@ -1,26 +1,41 @@
 from pathlib import Path
+import os
 import shutil
 import logging
-from zipfile import ZipFile, ZIP_DEFLATED
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from zipfile import ZipFile, ZIP_DEFLATED, ZIP_STORED
 from typing import Iterable
 
 import config
 from config import OUTPUT_DIR, out_path
 
+# Already-compressed formats: DEFLATE only burns CPU on these, so store them as-is
+_STORED_SUFFIXES = {".png", ".jpg", ".jpeg", ".zip", ".gz"}
+
+
+def _remove_output_item(item: Path) -> None:
+    """Delete a single file or directory under `OUTPUT_DIR`, reporting failures."""
+    try:
+        if item.is_file():
+            item.unlink()
+        elif item.is_dir():
+            shutil.rmtree(item)
+    except Exception as e:
+        print(f"Failed to delete {item}: {e}")
+
 
 def clean_outputs() -> None:
     """Delete all files and folders under the `OUTPUT_DIR`.
+
+    Items are independent, so removals run concurrently on a thread pool
+    (unlink/rmtree are I/O-bound and release the GIL).
     """
     print(f"Cleaning output directory: {OUTPUT_DIR}")
     if OUTPUT_DIR.exists():
-        for item in OUTPUT_DIR.iterdir():
-            try:
-                if item.is_file():
-                    item.unlink()
-                elif item.is_dir():
-                    shutil.rmtree(item)
-            except Exception as e:
-                print(f"Failed to delete {item}: {e}")
+        items = list(OUTPUT_DIR.iterdir())
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            list(ex.map(_remove_output_item, items))
     else:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -46,12 +61,18 @@ def zip_all_outputs(zip_filename: str | None = None, patterns: Iterable[str] = (
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Single directory scan (DirEntry caches stat info) instead of one glob per pattern
+    patterns = tuple(patterns)
+    with os.scandir(OUTPUT_DIR) as it:
+        entries = [entry for entry in it
+                   if entry.is_file() and any(fnmatch(entry.name, pat) for pat in patterns)]
+
     added = 0
-    with ZipFile(zip_path, "w", ZIP_DEFLATED) as zf:
-        for pat in patterns:
-            for p in OUTPUT_DIR.glob(pat):
-                if p.is_file():
-                    zf.write(p, arcname=p.name)
-                    added += 1
+    with ZipFile(zip_path, "w", ZIP_DEFLATED, compresslevel=1) as zf:
+        for entry in entries:
+            suffix = os.path.splitext(entry.name)[1].lower()
+            compress_type = ZIP_STORED if suffix in _STORED_SUFFIXES else ZIP_DEFLATED
+            zf.write(entry.path, arcname=entry.name, compress_type=compress_type)
+            added += 1
     print(f"Created zip: {zip_path.resolve()} ({added} files)")
     return zip_path
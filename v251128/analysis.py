@@ -6,6 +6,16 @@ import numpy as np
 from utils import print_section
 
 
+def sales_totals(df_clean):
+    """Total Sales_Volume per Model, Region and Year, computed once and shared by the consumers"""
+    # One pass over the rows; the three views are rolled up from the small cube
+    sales_cube = df_clean.groupby(['Model', 'Region', 'Year'], observed=True)['Sales_Volume'].sum()
+    model_sum = sales_cube.groupby(level='Model', observed=True).sum()
+    region_sum = sales_cube.groupby(level='Region', observed=True).sum()
+    year_sum = sales_cube.groupby(level='Year').sum()
+    return model_sum, region_sum, year_sum
+
+
 def aggregate_time_series(df_clean):
     """Aggregate data for time series analysis"""
     print_section("📈 TIME SERIES AGGREGATION")
@@ -3,6 +3,7 @@ Archived: alerts_helpers (moved from active pipeline)
 """
 
 import numpy as np
+import pandas as pd
 from config import (
     TEST_OVERALL_FORECAST_LOW, TEST_MODEL_UNDERPERFORMANCE,
     TEST_REGION_DECLINE, TEST_DECLINING_TREND, DECLINE_THRESHOLD
@@ -27,20 +28,24 @@ def run_alert_checks(alert_system, future_values, model_forecasts, df_region_yea
         )
         alert_system.alerts.extend(decline_alerts)
     
+    # Latest-year sales keyed by region, so each region is a hash lookup instead of a mask scan
+    latest_snapshot = (
+        df_region_yearly.loc[df_region_yearly['Year'] == latest_year]
+        .drop_duplicates('Region')
+        .set_index('Region')['Sales_Volume']
+    )
+    
     for region in unique_regions:
-        region_latest = df_region_yearly[
-            (df_region_yearly['Region'] == region) & 
-            (df_region_yearly['Year'] == latest_year)
-        ]['Sales_Volume'].values
+        region_latest = latest_snapshot.get(region)
         
-        if len(region_latest) > 0:
+        if region_latest is not None:
             region_threshold = region_thresholds.get(region, ALERT_THRESHOLD_OVERALL)
-            if region_latest[0] < region_threshold:
+            if region_latest < region_threshold:
                 alert_system.alerts.append({
                     'type': 'REGION_UNDERPERFORMANCE',
                     'severity': 'MEDIUM',
                     'region': region,
-                    'message': f'ALERT: Region {region} sales ({region_latest[0]:,.0f}) '
+                    'message': f'ALERT: Region {region} sales ({region_latest:,.0f}) '
                                f'below threshold ({region_threshold:,.0f})',
                 })
     
@@ -59,6 +64,15 @@ def inject_test_metrics(future_values, model_forecasts, df_region_yearly,
     
     original_future_values = future_values.copy()
     
+    # Clone each model history that scenarios 2/4 edit exactly once, then write in place
+    edited_models = set()
+    if TEST_MODEL_UNDERPERFORMANCE:
+        edited_models.update(top_models)
+    if TEST_DECLINING_TREND:
+        edited_models.update(m for m in top_models[:2] if m in model_forecasts)
+    for model in edited_models:
+        model_forecasts[model]['historical'] = np.array(model_forecasts[model]['historical'], copy=True)
+    
     # Scenario 1: Make overall forecast drop below threshold
     if TEST_OVERALL_FORECAST_LOW:
         future_values_test = np.array([
@@ -74,28 +88,28 @@ def inject_test_metrics(future_values, model_forecasts, df_region_yearly,
     # Scenario 2: Make top models underperform
     if TEST_MODEL_UNDERPERFORMANCE:
         for model in top_models:
-            model_forecasts[model]['historical'] = model_forecasts[model]['historical'].copy()
             model_forecasts[model]['historical'][-1] = model_thresholds[model] * 0.5
             print(f"✓ Model '{model}': Recent sales reduced to 50% of threshold")
     
     # Scenario 3: Create steep regional decline
     if TEST_REGION_DECLINE:
-        for region in unique_regions:
-            df_region_yearly.loc[
-                (df_region_yearly['Region'] == region) & 
-                (df_region_yearly['Year'] == latest_year), 
-                'Sales_Volume'
-            ] = region_thresholds[region] * 0.5
+        latest_mask = (
+            (df_region_yearly['Year'] == latest_year) &
+            df_region_yearly['Region'].isin(unique_regions)
+        )
+        latest_regions = df_region_yearly.loc[latest_mask, 'Region'].to_numpy()
+        df_region_yearly.loc[latest_mask, 'Sales_Volume'] = (
+            pd.Series(region_thresholds).reindex(latest_regions).to_numpy() * 0.5
+        )
         print(f"✓ Regional Sales: Set to 50% of threshold for latest year")
     
     # Scenario 4: Create declining trend
     if TEST_DECLINING_TREND:
         for model in top_models[:2]:
             if model in model_forecasts:
-                hist = model_forecasts[model]['historical'].copy()
+                hist = model_forecasts[model]['historical']
                 if len(hist) >= 2:
                     hist[-1] = hist[-2] * 0.8
-                    model_forecasts[model]['historical'] = hist
                     print(f"✓ Model '{model}': Created 20% decline in recent years")
     
     print("\n" + "="*80)
@@ -2,6 +2,7 @@
 Configuration and constants for BMW Sales Forecasting System
 """
 
+import functools
 from pathlib import Path
 import matplotlib
 import matplotlib.pyplot as plt
@@ -16,8 +17,9 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 OUTPUT_DIR = PROJECT_ROOT / 'outputs'
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+@functools.lru_cache(maxsize=128)
 def out_path(name: str) -> str:
-    """Return a path inside the outputs directory as a string."""
+    """Return a path inside the outputs directory as a string (cached per name)."""
     return str(OUTPUT_DIR / name)
 
 
@@ -26,6 +28,7 @@ warnings.filterwarnings('ignore')
 matplotlib.use('Agg')
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
+plt.rcParams['agg.path.chunksize'] = 10000  # draw long line paths in chunks
 
 # Pandas options
 pd.set_option('display.max_columns', None)
@@ -39,6 +42,15 @@ HOWTO_URL = 'https://raw.githubusercontent.com/StephenEastham/bmw-sales-forecast
 DATA_CSV_FILE = 'BMW-sales-data-2010-2024.csv'
 HOWTO_FILE = 'how-to-test.md'
 
+# Columns used by the pipeline and their load dtypes (keys are header names after stripping)
+CSV_DTYPES = {
+    'Model': 'category',
+    'Year': 'int16',
+    'Region': 'category',
+    'Price_USD': 'float32',
+    'Sales_Volume': 'int32',
+}
+
 # Forecasting parameters
 ARIMA_ORDER = (1, 1, 1)
 FORECAST_STEPS = 3
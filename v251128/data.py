@@ -3,39 +3,84 @@ Data loading, downloading, and preprocessing
 """
 
 import os
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from config import DATA_CSV_FILE, HOWTO_FILE, DATA_CSV_URL, HOWTO_URL
+from config import DATA_CSV_FILE, HOWTO_FILE, DATA_CSV_URL, HOWTO_URL, CSV_DTYPES
 from utils import print_section
 
 
-def download_data_file(file_name, data_url):
-    """Download data file from URL if not exists"""
-    if not os.path.exists(file_name):
+def download_data_file(file_name, data_url, attempts=3):
+    """Download data file from URL if not exists, retrying with exponential backoff"""
+    if os.path.exists(file_name):
+        print(f"✅ {file_name} already exists.")
+        return
+    
+    for attempt in range(1, attempts + 1):
         try:
             print(f"Attempting to download {file_name} from {data_url}...")
-            response = requests.get(data_url)
+            response = requests.get(data_url, timeout=30)
             response.raise_for_status()
             with open(file_name, 'wb') as f:
                 f.write(response.content)
             print(f"✅ {file_name} downloaded successfully!")
+            return
         except requests.exceptions.RequestException as e:
-            print(f"❌ Failed to download {file_name}. Please ensure the URL is correct and accessible.\nError: {e}")
-    else:
-        print(f"✅ {file_name} already exists.")
+            if attempt == attempts:
+                print(f"❌ Failed to download {file_name}. Please ensure the URL is correct and accessible.\nError: {e}")
+            else:
+                delay = 2 ** (attempt - 1)
+                print(f"⚠️ Download of {file_name} failed (attempt {attempt}/{attempts}), retrying in {delay}s...")
+                time.sleep(delay)
 
 
 def download_required_files():
-    """Download all required data files"""
-    download_data_file(DATA_CSV_FILE, DATA_CSV_URL)
-    download_data_file(HOWTO_FILE, HOWTO_URL)
+    """Download all required data files concurrently"""
+    files = [(DATA_CSV_FILE, DATA_CSV_URL), (HOWTO_FILE, HOWTO_URL)]
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        list(pool.map(download_data_file, *zip(*files)))
+
+
+def _read_csv_arrow(csv_path, dtypes):
+    """Stream the CSV through pyarrow's block reader and convert to pandas once"""
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    
+    def arrow_type(dtype):
+        if dtype == 'category':
+            return pa.dictionary(pa.int32(), pa.string())
+        return pa.type_for_alias(dtype)
+    
+    reader = pacsv.open_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=64 << 20),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=list(dtypes),
+            column_types={col: arrow_type(dtype) for col, dtype in dtypes.items()},
+        ),
+    )
+    table = pa.Table.from_batches(list(reader), schema=reader.schema)
+    # Dictionary columns come back as pandas categoricals, numerics as numpy
+    df = table.to_pandas()
+    # Arrow orders categories by first appearance; sort them as pandas would
+    for col, dtype in dtypes.items():
+        if dtype == 'category':
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
+    return df
 
 
 def load_and_explore_data(csv_path):
     """Load and display dataset overview"""
     print_section("📊 DATASET OVERVIEW")
     
-    df = pd.read_csv(csv_path)
+    # Header names are space-padded in the CSV, so map the padded names to CSV_DTYPES
+    header = pd.read_csv(csv_path, nrows=0).columns
+    dtypes = {col: CSV_DTYPES[col.strip()] for col in header if col.strip() in CSV_DTYPES}
+    try:
+        df = _read_csv_arrow(csv_path, dtypes)
+    except ImportError:
+        df = pd.read_csv(csv_path, usecols=list(dtypes), dtype=dtypes)
     print(f"\n✅ Data loaded successfully!")
     print(f"Shape: {df.shape}")
     print(f"\nFirst few rows:")
@@ -83,6 +128,11 @@ def preprocess_data(df):
     else:
         print("\n✅ No empty columns found. All columns contain at least one non-empty value.")
 
+    # Integer-coded groupby keys; a no-op when the reader already produced categories
+    for col in ('Model', 'Region'):
+        if col in df_clean.columns:
+            df_clean[col] = df_clean[col].astype('category')
+
     print(f"\n✅ Data preprocessing complete. Shape: {df_clean.shape}")
     print(f"\n📊 Cleaned columns:")
     print(df_clean.columns.tolist())
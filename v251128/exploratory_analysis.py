@@ -3,21 +3,25 @@ Exploratory Data Analysis module
 """
 
 from utils import print_section
+from analysis import sales_totals
 
-def exploratory_data_analysis(df_clean):
+def exploratory_data_analysis(df_clean, model_sum=None, region_sum=None, year_sum=None):
     """Perform EDA"""
     print_section("📊 EXPLORATORY DATA ANALYSIS")
     
+    if model_sum is None or region_sum is None or year_sum is None:
+        model_sum, region_sum, year_sum = sales_totals(df_clean)
+    
     print("\n🏎️ Sales by Model (Top 10):")
-    model_sales = df_clean.groupby('Model')['Sales_Volume'].sum().sort_values(ascending=False)
+    model_sales = model_sum.sort_values(ascending=False)
     print(model_sales.head(10))
     
     print("\n🌍 Sales by Region:")
-    region_sales = df_clean.groupby('Region')['Sales_Volume'].sum().sort_values(ascending=False)
+    region_sales = region_sum.sort_values(ascending=False)
     print(region_sales)
     
     print("\n📅 Sales by Year:")
-    year_sales = df_clean.groupby('Year')['Sales_Volume'].sum().sort_values()
+    year_sales = year_sum.sort_values()
     print(year_sales)
     
     print("\n📈 Sales Volume Statistics:")
@@ -3,13 +3,17 @@ Reporting and data export
 """
 
 import pandas as pd
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
 from config import out_path
 from utils import print_section
+from analysis import sales_totals
 
 
 def generate_monthly_report(alerts, forecast_data, df_clean, average_sales, 
-                           future_values, ts_data, future_years, ALERT_THRESHOLD_OVERALL):
+                           future_values, ts_data, future_years, ALERT_THRESHOLD_OVERALL,
+                           model_sum=None, region_sum=None):
     """Generate comprehensive monthly report.
 
     This version is resilient to forecasting being disabled. If `future_values`
@@ -19,6 +23,9 @@ def generate_monthly_report(alerts, forecast_data, df_clean, average_sales,
 
     timestamp = datetime.now()
 
+    if model_sum is None or region_sum is None:
+        model_sum, region_sum, _ = sales_totals(df_clean)
+
     # Safe summary values
     forecast_summary = "Forecasting disabled"
     forecast_trend = "N/A"
@@ -34,7 +41,7 @@ def generate_monthly_report(alerts, forecast_data, df_clean, average_sales,
     except Exception:
         forecast_summary = "Forecasting disabled"
 
-    report = f"""
+    parts = [f"""
 {'='*80}
 BMW SALES ANALYTICS - MONTHLY REPORT
 Generated: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}
@@ -55,44 +62,46 @@ Generated: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}
 
 3. ALERTS & ACTION ITEMS
 {'─'*80}
-"""
+"""]
 
     if alerts:
         for i, alert in enumerate(alerts, 1):
-            report += f"\n   Alert {i}: {alert.get('message', '')}"
+            parts.append(f"\n   Alert {i}: {alert.get('message', '')}")
             if 'gap' in alert:
-                report += f"\n              Gap from threshold: {alert['gap']:,.0f}"
+                parts.append(f"\n              Gap from threshold: {alert['gap']:,.0f}")
     else:
-        report += "\n   No alerts triggered. All metrics within acceptable range."
+        parts.append("\n   No alerts triggered. All metrics within acceptable range.")
 
-    report += "\n\n4. FORECAST OUTLOOK (NEXT 3 YEARS)\n" + ('─'*80) + "\n"
+    parts.append("\n\n4. FORECAST OUTLOOK (NEXT 3 YEARS)\n" + ('─'*80) + "\n")
 
     if future_years is not None and future_values is not None and len(future_years) == len(future_values):
         for year, value in zip(future_years, future_values):
             trend = "UP" if (ts_data is not None and len(ts_data) > 0 and value > ts_data[-1]) else "N/A"
-            report += f"\n   {int(year)}: {value:,.0f} [{trend}]"
+            parts.append(f"\n   {int(year)}: {value:,.0f} [{trend}]")
     else:
-        report += "\n   Forecasting disabled for this run.\n"
+        parts.append("\n   Forecasting disabled for this run.\n")
 
-    report += f"\n\n5. MODEL PERFORMANCE (Top 5)\n" + ('─'*80) + "\n"
+    parts.append(f"\n\n5. MODEL PERFORMANCE (Top 5)\n" + ('─'*80) + "\n")
 
-    top_performers = df_clean.groupby('Model')['Sales_Volume'].sum().nlargest(5)
+    top_performers = model_sum.nlargest(5)
     for i, (model, sales) in enumerate(top_performers.items(), 1):
-        report += f"\n   {i}. {model}: {sales:,.0f}"
+        parts.append(f"\n   {i}. {model}: {sales:,.0f}")
 
-    report += f"\n\n6. REGIONAL PERFORMANCE\n" + ('─'*80) + "\n"
+    parts.append(f"\n\n6. REGIONAL PERFORMANCE\n" + ('─'*80) + "\n")
 
-    by_region = df_clean.groupby('Region')['Sales_Volume'].sum().sort_values(ascending=False)
+    by_region = region_sum.sort_values(ascending=False)
     for region, sales in by_region.items():
         pct = (sales / by_region.sum() * 100)
-        report += f"\n   • {region}: {sales:,.0f} ({pct:.1f}%)"
+        parts.append(f"\n   • {region}: {sales:,.0f} ({pct:.1f}%)")
 
-    report += f"\n\n7. RECOMMENDATIONS\n" + ('─'*80) + "\n"
-    report += "   • Monitor underperforming models closely\n"
-    report += "   • Invest in high-growth regions\n"
-    report += "   • Adjust inventory based on demand signals\n"
-    report += "   • Review market conditions quarterly\n\n"
-    report += ('='*80) + "\nEND OF REPORT\n" + ('='*80) + "\n"
+    parts.append(f"\n\n7. RECOMMENDATIONS\n" + ('─'*80) + "\n")
+    parts.append("   • Monitor underperforming models closely\n")
+    parts.append("   • Invest in high-growth regions\n")
+    parts.append("   • Adjust inventory based on demand signals\n")
+    parts.append("   • Review market conditions quarterly\n\n")
+    parts.append(('='*80) + "\nEND OF REPORT\n" + ('='*80) + "\n")
+
+    report = ''.join(parts)
 
     return report
 
@@ -108,16 +117,20 @@ def export_data(*args, **kwargs):
 
 
 def generate_final_summary(df_clean, average_sales, ts_years, ts_data, future_years, 
-                          future_values, model_forecasts, alert_system):
+                          future_values, model_forecasts, alert_system,
+                          model_sum=None, region_sum=None):
     """Generate and save final summary (safe when forecasting/alerts disabled)."""
     import numpy as np
 
+    if df_clean is not None and (model_sum is None or region_sum is None):
+        model_sum, region_sum, _ = sales_totals(df_clean)
+
     # Build a summary that does not reference forecasting/alerts when disabled
     total_records = len(df_clean) if df_clean is not None else 0
     year_min = int(df_clean['Year'].min()) if (df_clean is not None and 'Year' in df_clean.columns) else 'N/A'
     year_max = int(df_clean['Year'].max()) if (df_clean is not None and 'Year' in df_clean.columns) else 'N/A'
-    top_model = df_clean.groupby('Model')['Sales_Volume'].sum().idxmax() if (df_clean is not None and 'Model' in df_clean.columns) else 'N/A'
-    top_region = df_clean.groupby('Region')['Sales_Volume'].sum().idxmax() if (df_clean is not None and 'Region' in df_clean.columns) else 'N/A'
+    top_model = model_sum.idxmax() if (df_clean is not None and 'Model' in df_clean.columns) else 'N/A'
+    top_region = region_sum.idxmax() if (df_clean is not None and 'Region' in df_clean.columns) else 'N/A'
 
     # Historical performance safe values
     avg_sales = average_sales
@@ -128,13 +141,14 @@ def generate_final_summary(df_clean, average_sales, ts_years, ts_data, future_ye
     trend = 'N/A'
     try:
         if ts_years is not None and ts_data is not None and len(ts_years) > 0 and len(ts_data) > 0:
-            peak_idx = int(np.argmax(ts_data))
+            ts32 = np.asarray(ts_data).astype(np.int32, copy=False)
+            peak_idx = int(ts32.argmax())
             peak_year = int(ts_years[peak_idx])
-            peak_value = int(ts_data.max())
-            low_idx = int(np.argmin(ts_data))
+            peak_value = int(ts32[peak_idx])
+            low_idx = int(ts32.argmin())
             low_year = int(ts_years[low_idx])
-            low_value = int(ts_data.min())
-            trend = 'GROWING' if ts_data[-1] > ts_data[0] else 'DECLINING'
+            low_value = int(ts32[low_idx])
+            trend = 'GROWING' if ts32[-1] > ts32[0] else 'DECLINING'
     except Exception:
         pass
 
@@ -144,9 +158,10 @@ def generate_final_summary(df_clean, average_sales, ts_years, ts_data, future_ye
     med_sev = 0
     if alert_system is not None and hasattr(alert_system, 'alerts'):
         try:
-            alerts_count = len(alert_system.alerts)
-            high_sev = len([a for a in alert_system.alerts if a.get('severity') == 'HIGH'])
-            med_sev = len([a for a in alert_system.alerts if a.get('severity') == 'MEDIUM'])
+            severities = Counter(a.get('severity') for a in alert_system.alerts)
+            alerts_count = sum(severities.values())
+            high_sev = severities['HIGH']
+            med_sev = severities['MEDIUM']
         except Exception:
             alerts_count = 0
 
@@ -206,7 +221,6 @@ PROJECT STATUS: ANALYSIS COMPLETE (Forecasting & Alerts Disabled)
 
     print(summary)
 
-    with open(out_path('ANALYSIS_SUMMARY.txt'), 'w', encoding='utf-8') as f:
-        f.write(summary)
+    Path(out_path('ANALYSIS_SUMMARY.txt')).write_bytes(summary.encode('utf-8'))
 
     print(f"\n[OK] Saved: {out_path('ANALYSIS_SUMMARY.txt')}")
@@ -6,12 +6,16 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from config import out_path
 from utils import print_section
+from analysis import sales_totals
 
 def create_interactive_dashboard(ts_years, ts_data, future_years, future_values, 
-                                 df_yearly, df_clean):
+                                 df_yearly, df_clean, model_sum=None, region_sum=None):
     """Create interactive Plotly dashboard"""
     print_section("📊 CREATING INTERACTIVE DASHBOARD")
     
+    if model_sum is None or region_sum is None:
+        model_sum, region_sum, _ = sales_totals(df_clean)
+    
     fig_forecast = make_subplots(
         rows=2, cols=2,
         subplot_titles=(
@@ -65,7 +69,7 @@ def create_interactive_dashboard(ts_years, ts_data, future_years, future_values,
         row=1, col=2
     )
     
-    top_5_models = df_clean.groupby('Model')['Sales_Volume'].sum().nlargest(5).sort_values()
+    top_5_models = model_sum.nlargest(5).sort_values()
     fig_forecast.add_trace(
         go.Bar(
             y=top_5_models.index, x=top_5_models.values,
@@ -75,7 +79,7 @@ def create_interactive_dashboard(ts_years, ts_data, future_years, future_values,
         row=2, col=1
     )
     
-    region_dist = df_clean.groupby('Region')['Sales_Volume'].sum()
+    region_dist = region_sum
     fig_forecast.add_trace(
         go.Pie(
             labels=region_dist.index, values=region_dist.values,